@@ -70,11 +70,12 @@ def _read_csv_rows(path: pathlib.Path) -> tuple:
 	# file_io_protein readers' policy).
 	with open(path, "r", encoding="utf-8-sig", newline="") as handle:
 		reader = csv.reader(handle)
-		all_rows = list(reader)
-	if not all_rows:
+		# Pull the header off the stream so the data rows are collected
+		# once, not materialized and then copied by a [1:] slice.
+		header = next(reader, None)
+		rows = list(reader)
+	if header is None:
 		raise ValueError(f"CSV is empty: {path}")
-	header = all_rows[0]
-	rows = all_rows[1:]
 	return header, rows
 
 
@@ -104,9 +105,10 @@ def _build_key_map(header: list, rows: list, label: str) -> tuple:
 		required=_KEY_REQUIRED_COLUMNS)
 	id_idx = resolved["Student ID"]
 	ts_idx = resolved["timestamp"]
+	last_key_idx = max(id_idx, ts_idx)
 	key_map = {}
 	for row in rows:
-		if len(row) <= max(id_idx, ts_idx):
+		if len(row) <= last_key_idx:
 			continue
 		student_id = row[id_idx].strip()
 		timestamp = row[ts_idx].strip()
@@ -7,6 +7,7 @@ import random
 import shutil
 import pathlib
 import argparse
+import collections
 
 # PIP3 modules
 import yaml
@@ -86,6 +87,13 @@ def parse_args():
 # regex: BCHM_Prot_Img_NN-<anything>.csv where NN is two digits 01-20
 CANONICAL_FORM_CSV_RE = re.compile(r'^BCHM_Prot_Img_(\d{2})-.+\.csv$')
 
+# Roosevelt RUIDs start with one of these literal prefixes (docs/RUID_POLICY.md);
+# str.startswith tests the whole tuple in one call.
+RUID_PREFIXES = ('900', '960')
+
+# one- or two-digit runs scanned by extract_number_in_range
+_SHORT_NUMBER_RE = re.compile(r'\d{1,2}')
+
 
 #============================================
 def extract_image_number_from_csv_basename(basename: str) -> int:
@@ -378,15 +386,18 @@ def find_first_name_key_index_from_header(header: list) -> int:
 	Returns:
 		int: Index of the first name column, or None if not found.
 	"""
+	# One pass: a "first name" column wins outright, otherwise fall back
+	# to the earliest "full name" column seen along the way.
+	full_name_index = None
 	for i, item in enumerate(header):
 		sitem = item.strip().lower()
-		if 'first' in sitem and 'name' in sitem:
-			return i
-	for i, item in enumerate(header):
-		sitem = item.strip().lower()
-		if 'full' in sitem and 'name' in sitem:
+		if 'name' not in sitem:
+			continue
+		if 'first' in sitem:
 			return i
-	return None
+		if full_name_index is None and 'full' in sitem:
+			full_name_index = i
+	return full_name_index
 
 #============================================
 def read_csv(csvfile: str, maxstudents: int) -> tuple:
@@ -425,9 +436,9 @@ def extract_number_in_range(s: str) -> int:
 	"""
 	Extract the first integer between 1 and 20 (inclusive) from the string.
 	"""
-	matches = re.findall(r'\d{1,2}', s)
-	for match in matches:
-		num = int(match)
+	# finditer stops at the first in-range number instead of collecting all
+	for match in _SHORT_NUMBER_RE.finditer(s):
+		num = int(match.group())
 		if 1 <= num <= 20:
 			return num
 	raise ValueError(f"No number in range 1-20 found in string: {s}")
@@ -504,7 +515,7 @@ def _extract_form_ruid_from_row(row: list, header: list,
 		if not item:
 			continue
 		stripped = item.strip()
-		if stripped.startswith('900') or stripped.startswith('960'):
+		if stripped.startswith(RUID_PREFIXES):
 			return stripped
 	return ""
 
@@ -539,6 +550,8 @@ def generate_html(csvfile: str, header: list, data_tree: list, args, image_dir:
 	col_first_idx = standard_indices["First Name"]
 	col_last_idx = standard_indices["Last Name"]
 	col_username_idx = standard_indices["Username"]
+	# Header labels are the same for every row, so strip them once.
+	header_labels = [label.strip() for label in header]
 
 	with open(output_html, "w") as output:
 		write_header(output, csvfile)
@@ -598,9 +611,10 @@ def generate_html(csvfile: str, header: list, data_tree: list, args, image_dir:
 				)
 
 			for i, item in enumerate(row):
-				if len(item) < 1:
+				# Most answer cells are blank; reject them before any prefix checks
+				if not item:
 					continue
-				elif item.startswith('900') or item.startswith('960'):
+				elif item.startswith(RUID_PREFIXES):
 					# Already consumed by the resolver above; do not
 					# emit the typed RUID into the HTML page.
 					continue
@@ -610,7 +624,7 @@ def generate_html(csvfile: str, header: list, data_tree: list, args, image_dir:
 					)
 					output.write(f"{img_html_tag}\n")
 				else:
-					output.write(f"<p><b>{header[i].strip()}</b>:&nbsp; {row[i].strip()}</p>\n")
+					output.write(f"<p><b>{header_labels[i]}</b>:&nbsp; {item.strip()}</p>\n")
 
 #============================================
 def open_html_in_browser(html_path: str):
@@ -636,15 +650,13 @@ def _submission_history_by_student(all_submissions: list | None) -> dict:
 	"""
 	Return {Student ID: [submission rows]} for form rows in original order.
 	"""
-	history: dict = {}
+	history = collections.defaultdict(list)
 	if all_submissions is None:
 		return history
 	for row in all_submissions:
 		student_id = str(row.get("Student ID", "")).strip()
 		if not student_id:
 			continue
-		if student_id not in history:
-			history[student_id] = []
 		history[student_id].append(row)
 	return history
 
@@ -781,7 +793,7 @@ def resolve_csv_paths(args) -> list:
 				f"No canonical form CSVs found in {forms_dir}"
 			)
 		paths = []
-		for image_number in sorted(by_image.keys()):
+		for image_number in sorted(by_image):
 			matches = by_image[image_number]
 			if len(matches) >= 2:
 				listing = "\n".join(f"    {p}" for p in matches)
@@ -1,6 +1,7 @@
 # Standard Library
 import os
 import re
+import functools
 import collections
 
 # PIP3 modules
@@ -18,6 +19,11 @@ warning_color = rich.style.Style(color="rgb(255, 187, 51)")  # RGB for bright or
 question_color = rich.style.Style(color="rgb(100, 149, 237)" )  # RGB for cornflower blue
 data_color = rich.style.Style(color="rgb(187, 51, 255)")  # RGB for purple
 
+# Downloaded image filenames start with the student's 9-digit RUID
+_RUID_PREFIX_RE = re.compile(r'^([0-9]{9})')
+# imagehash writes lowercase hex, where equal characters mean equal nibbles
+_LOWER_HEX_RE = re.compile(r'[0-9a-f]+')
+
 #============================================
 def hex_to_bin(hex_string: str) -> str:
 	"""Convert a hex string to its binary representation."""
@@ -32,6 +38,45 @@ def hamming_distance(s1: str, s2: str) -> int:
 	distance = sum(ch1 != ch2 for ch1, ch2 in zip(s1, s2))
 	return distance
 
+#============================================
+def phash_to_int(phash: str | None) -> int | None:
+	"""
+	Return the integer value of a lowercase hex phash, or None otherwise.
+
+	Only lowercase hex is converted, so the nibble count from
+	phash_distance() always equals the character count from
+	hamming_distance().
+	"""
+	if not isinstance(phash, str) or not _LOWER_HEX_RE.fullmatch(phash):
+		return None
+	phash_int = int(phash, 16)
+	return phash_int
+
+#============================================
+@functools.lru_cache(maxsize=8)
+def _nibble_mask(hex_length: int) -> int:
+	"""Integer with the lowest bit of each of hex_length nibbles set."""
+	nibble_mask = int('1' * hex_length, 16)
+	return nibble_mask
+
+#============================================
+def phash_distance(phash1: str, phash_int1: int | None, phash2: str, phash_int2: int | None) -> int:
+	"""
+	Count differing hex characters between two phashes.
+
+	Same result as hamming_distance(phash1, phash2), but when both
+	phashes have integer forms from phash_to_int() the count is done
+	with a few integer operations instead of a per-character loop.
+	"""
+	if phash_int1 is None or phash_int2 is None or len(phash1) != len(phash2):
+		return hamming_distance(phash1, phash2)
+	diff = phash_int1 ^ phash_int2
+	# fold each 4-bit nibble onto its lowest bit, then count those bits
+	diff |= diff >> 1
+	diff |= diff >> 2
+	distance = (diff & _nibble_mask(len(phash1))).bit_count()
+	return distance
+
 #============================================
 def get_ruid_prefix(filename: str) -> str:
 	"""
@@ -44,7 +89,7 @@ def get_ruid_prefix(filename: str) -> str:
 		The 9-digit RUID string if found, otherwise an empty string.
 	"""
 	base_name = os.path.basename(filename)
-	match = re.match(r'^([0-9]{9})', base_name)
+	match = _RUID_PREFIX_RE.match(base_name)
 	if match is None:
 		return ""
 	return match.group(1)
@@ -198,6 +243,16 @@ def find_similar_duplicates(student_tree: list, image_hashes: dict, local_image_
 
 	list_of_sets = []
 
+	# convert every stored phash to an integer once, not once per student
+	archive_phashes = [
+		(old_phash, oldfilename, phash_to_int(old_phash))
+		for old_phash, oldfilename in image_hashes['phash'].items()
+	]
+	local_phashes = [
+		(local_phash, output_filename_list, phash_to_int(local_phash))
+		for local_phash, output_filename_list in local_image_hashes['phash'].items()
+	]
+
 	for student_entry in student_tree:
 		if student_entry.get('Exact Match') is True:
 			# no need to do it more than once
@@ -207,13 +262,14 @@ def find_similar_duplicates(student_tree: list, image_hashes: dict, local_image_
 			continue
 		student_entry['Similar Match'] = False
 		phash = student_entry['Perceptual Hash']
+		phash_int = phash_to_int(phash)
 		output_filename = student_entry['Output Filename']
 		student_ruid = get_ruid_prefix(output_filename)
 		dup_image_filenames = set()
 		dup_image_filenames.add(output_filename)
 		cutoff = 38
-		for old_phash, oldfilename in image_hashes['phash'].items():
-			ham_dist = hamming_distance(phash, old_phash)
+		for old_phash, oldfilename, old_phash_int in archive_phashes:
+			ham_dist = phash_distance(phash, phash_int, old_phash, old_phash_int)
 			comparisons += 1
 			if ham_dist < cutoff:
 				if student_ruid and has_same_ruid(output_filename, oldfilename):
@@ -222,10 +278,10 @@ def find_similar_duplicates(student_tree: list, image_hashes: dict, local_image_
 				console.print(f"PHASH CLASH: {phash[:8]} and {old_phash[:8]} distance: {ham_dist}, file: {oldfilename}", style=warning_color)
 				dup_image_filenames.add(oldfilename)
 
-		for local_phash, output_filename_list in local_image_hashes['phash'].items():
+		for local_phash, output_filename_list, local_phash_int in local_phashes:
 			if local_phash == phash:
 				continue
-			ham_dist = hamming_distance(phash, local_phash)
+			ham_dist = phash_distance(phash, phash_int, local_phash, local_phash_int)
 			comparisons += 1
 			if ham_dist < cutoff:
 				student_entry['Similar Match'] = True
@@ -245,6 +301,8 @@ def find_similar_duplicates(student_tree: list, image_hashes: dict, local_image_
 			student_entry['Warnings'].append("You have submitted a very similar images to other students, please make your image more unique in the future or could lost points.")
 
 	non_overlapping_group_sets = get_non_overlapping_group_sets(list_of_sets)
+	# one filename index for every group the grader confirms below
+	student_by_filename = index_students_by_filename(student_tree)
 
 	for group_num, group_set in enumerate(non_overlapping_group_sets, start=1):
 		print(f"GROUP NUMBER {group_num}")
@@ -267,17 +325,17 @@ def find_similar_duplicates(student_tree: list, image_hashes: dict, local_image_
 			print("No matching files exist to open for this group")
 		validation = student_id_protein.get_input_validation("Are these images exactly the same?", 'yn', question_color)
 		if validation == 'y':
-			mark_images_as_duplicates(group_set, student_tree)
+			mark_images_as_duplicates(group_set, student_by_filename)
 			continue
 		validation = student_id_protein.get_input_validation("Are these images like the basic?", 'yn', question_color)
 		if validation == 'y':
 			warning_msg = 'Your image was generated by just doing the default. Next time move the protein structure around or change the color, so your image is more unique.'
-			mark_images_with_warning(group_set, warning_msg, student_tree)
+			mark_images_with_warning(group_set, warning_msg, student_by_filename)
 			continue
 		validation = student_id_protein.get_input_validation("Are these images similar enough to warrent a warning?", 'yn', question_color)
 		if validation == 'y':
 			warning_msg = 'Your image was very similar to another student. Next time move the protein structure around or change the color, so your image is more unique.'
-			mark_images_with_warning(group_set, warning_msg, student_tree)
+			mark_images_with_warning(group_set, warning_msg, student_by_filename)
 			continue
 
 	print(f"Made {comparisons:,d} comparisons looking for similar images")
@@ -290,8 +348,21 @@ def find_student_entry_by_filename(output_filename: str, student_tree: list):
 				continue
 			return student_entry
 
+#============================================
+def index_students_by_filename(student_tree: list) -> dict:
+	"""
+	Map each 'Output Filename' to its student entry, keeping the first
+	entry for a filename just like find_student_entry_by_filename().
+	"""
+	student_by_filename = {}
+	for student_entry in student_tree:
+		student_by_filename.setdefault(student_entry['Output Filename'], student_entry)
+	return student_by_filename
+
 #============================================
 def find_exact_local_duplicates(student_tree: list, local_image_hashes: dict):
+	# one filename index for every duplicate group found below
+	student_by_filename = index_students_by_filename(student_tree)
 	for student_entry in student_tree:
 		if student_entry.get('Exact Match') is True:
 			# no need to do it more than once
@@ -316,20 +387,20 @@ def find_exact_local_duplicates(student_tree: list, local_image_hashes: dict):
 			continue
 		student_id_protein.print_student_info(student_entry)
 		student_entry['Exact Match'] = True
-		mark_images_as_duplicates(dup_image_filenames, student_tree)
+		mark_images_as_duplicates(dup_image_filenames, student_by_filename)
 		system_cmd = "open " + " ".join(sorted(dup_image_filenames))
 		#os.system(system_cmd)
 		print(system_cmd)
 
 #============================================
-def mark_images_with_warning(dup_image_filenames_list, warning_msg, student_tree):
+def mark_images_with_warning(dup_image_filenames_list, warning_msg, student_by_filename: dict):
 	dup_image_filenames_list = filter_duplicate_group_by_ruid(set(dup_image_filenames_list))
 	if len(dup_image_filenames_list) == 1:
 		return
 	for output_filename in dup_image_filenames_list:
 		if not output_filename.startswith("DOWNLOAD_"):
 			continue
-		dup_student = find_student_entry_by_filename(output_filename, student_tree)
+		dup_student = student_by_filename.get(output_filename)
 		if dup_student is None:
 			continue
 		dup_student['Similar Match'] = True
@@ -337,7 +408,7 @@ def mark_images_with_warning(dup_image_filenames_list, warning_msg, student_tree
 	return
 
 #============================================
-def mark_images_as_duplicates(dup_image_filenames_list, student_tree):
+def mark_images_as_duplicates(dup_image_filenames_list, student_by_filename: dict):
 	student_names = set()
 	dup_image_filenames_list = filter_duplicate_group_by_ruid(set(dup_image_filenames_list))
 	if len(dup_image_filenames_list) == 1:
@@ -345,7 +416,7 @@ def mark_images_as_duplicates(dup_image_filenames_list, student_tree):
 	for output_filename in dup_image_filenames_list:
 		if not output_filename.startswith("DOWNLOAD_"):
 			continue
-		dup_student = find_student_entry_by_filename(output_filename, student_tree)
+		dup_student = student_by_filename[output_filename]
 		dup_student['Exact Match'] = True
 		# Format the student's name with first name and initial of the last name
 		student_name = f"{dup_student['First Name']} {dup_student['Last Name'][0]}."
@@ -361,7 +432,7 @@ def mark_images_as_duplicates(dup_image_filenames_list, student_tree):
 
 
 	for output_filename in dup_image_filenames_list:
-		dup_student = find_student_entry_by_filename(output_filename, student_tree)
+		dup_student = student_by_filename.get(output_filename)
 		if dup_student is None:
 			continue
 		if not 'Warnings' in dup_student:
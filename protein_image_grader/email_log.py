@@ -72,7 +72,7 @@ def _ordered_student_record(record: dict) -> dict:
 		ordered["username"] = record["username"]
 	if "email" in record:
 		ordered["email"] = record["email"]
-	image_keys = sorted(k for k in record.keys()
+	image_keys = sorted(k for k in record
 		if k.startswith("image_"))
 	for key in image_keys:
 		ordered[key] = record[key]
@@ -93,7 +93,7 @@ def save(term: str, data: dict) -> None:
 
 	# Build an ordered copy so safe_dump preserves our layout.
 	ordered = {}
-	for student_id in sorted(data.keys()):
+	for student_id in sorted(data):
 		ordered[student_id] = _ordered_student_record(data[student_id])
 
 	# Write to a sibling tempfile and atomically replace the target.
@@ -202,19 +202,18 @@ def summarize_image_by_submission(data: dict, image_number: int,
 	if not expected_ids:
 		return "MISSING"
 
-	statuses = []
-	for student_id in expected_ids:
-		statuses.append(get_status(data, student_id, image_number))
-	any_status = any(status is not None for status in statuses)
+	# Look each student up once; the checks below reuse these statuses.
+	statuses = {
+		student_id: get_status(data, student_id, image_number)
+		for student_id in expected_ids
+	}
+	any_status = any(status is not None for status in statuses.values())
 	if not any_status:
 		return "MISSING"
 
-	for student_id in submitted_ids:
-		status = get_status(data, student_id, image_number)
-		if status != "sent":
-			return "PARTIAL"
-	for student_id in expected_ids - submitted_ids:
-		status = get_status(data, student_id, image_number)
-		if status not in CLOSING_STATUSES:
-			return "PARTIAL"
+	if any(statuses[student_id] != "sent" for student_id in submitted_ids):
+		return "PARTIAL"
+	non_submitter_ids = expected_ids - submitted_ids
+	if any(statuses[student_id] not in CLOSING_STATUSES for student_id in non_submitter_ids):
+		return "PARTIAL"
 	return "OK"
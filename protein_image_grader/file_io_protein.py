@@ -33,15 +33,16 @@ def _short_path(path: str) -> str:
 	# Rewrite through a CWD symlink whose target prefixes `path`.
 	cwd = os.getcwd()
 	real_path = os.path.realpath(path)
-	for entry in os.listdir(cwd):
-		full = os.path.join(cwd, entry)
-		if not os.path.islink(full):
-			continue
-		link_real = os.path.realpath(full)
-		# `+ os.sep` guards against false prefix matches like /foo vs /foobar.
-		if real_path == link_real or real_path.startswith(link_real + os.sep):
-			tail = real_path[len(link_real):].lstrip(os.sep)
-			candidates.append(os.path.join(entry, tail) if tail else entry)
+	# scandir reports symlinks from the directory listing, no lstat per entry
+	with os.scandir(cwd) as entries:
+		for entry in entries:
+			if not entry.is_symlink():
+				continue
+			link_real = os.path.realpath(entry.path)
+			# `+ os.sep` guards against false prefix matches like /foo vs /foobar.
+			if real_path == link_real or real_path.startswith(link_real + os.sep):
+				tail = real_path[len(link_real):].lstrip(os.sep)
+				candidates.append(os.path.join(entry.name, tail) if tail else entry.name)
 	# cwd-relative (will use the symlinked form if path was already given that way)
 	candidates.append(os.path.relpath(path))
 	# HOME-relative with ~
@@ -100,6 +101,12 @@ def read_student_csv_data(input_csv: str, config: dict) -> list:
 
 	# csv_questions is a list of dicts in the YAML; default to empty list.
 	csv_questions_list = config.get("csv_questions", [])
+	# Resolve each question's stripped name and 0-based column once,
+	# rather than once per student row.
+	question_columns = [
+		(csv_question_dict['name'].strip(), csv_question_dict['csv_column'] - 1)
+		for csv_question_dict in csv_questions_list
+	]
 
 	# Initialize a list to hold the student entries
 	student_tree = []
@@ -133,10 +140,8 @@ def read_student_csv_data(input_csv: str, config: dict) -> list:
 				student_entry[meta_key] = row_list[index_one_based - 1].strip()
 
 			# Populate the questions for the student
-			for csv_question_dict in csv_questions_list:
-				index = csv_question_dict['csv_column']
-				name = csv_question_dict['name'].strip()
-				student_entry[name] = row_list[index-1].strip()
+			for name, index in question_columns:
+				student_entry[name] = row_list[index].strip()
 			student_entry['Protein Image Number'] = config['image number']
 
 			student_entry['Warnings'] = []
@@ -273,9 +278,8 @@ def write_output_file(output_csv: str, student_tree: list) -> None:
 	for student in student_tree:
 		all_headers.update(student.keys())
 
-	# Convert the set of unique headers into a sorted list
-	headers = list(all_headers)
-	headers.sort()
+	# Sort the set of unique headers straight into a list
+	headers = sorted(all_headers)
 
 	# Open the file in write mode. Comma-delimited + UTF-8 so the file
 	# round-trips cleanly through spreadsheet tools. csv.DictWriter
@@ -59,6 +59,9 @@ LEGACY_YAML_META_KEYS = frozenset(
 	{"timestamp", "Username", "First Name", "Last Name", "Student ID", "email"}
 )
 
+# Runs of anything that is not a lowercase letter or digit separate tokens.
+_NON_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+
 
 #============================================
 def _tokenize_header(text: str) -> list:
@@ -76,7 +79,7 @@ def _tokenize_header(text: str) -> list:
 	cleaned = unicodedata.normalize("NFKC", text)
 	cleaned = unidecode.unidecode(cleaned).lower()
 	# Replace any non-alphanumeric run with a single space, then split.
-	cleaned = re.sub(r"[^a-z0-9]+", " ", cleaned).strip()
+	cleaned = _NON_TOKEN_RE.sub(" ", cleaned).strip()
 	if not cleaned:
 		return []
 	return cleaned.split()
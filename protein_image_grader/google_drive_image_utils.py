@@ -4,6 +4,7 @@ import os
 import time
 import random
 import hashlib
+import collections
 import urllib.parse
 
 # PIP3 modules
@@ -69,15 +70,12 @@ def find_service_key_file(filename: str = "service_key.json") -> str:
 	candidates.append(os.path.join(home_dir, "Documents", filename))
 	candidates.append(os.path.join(script_dir, filename))
 
-	for entry in os.listdir(cwd):
-		entry_path = os.path.join(cwd, entry)
-		if os.path.isdir(entry_path):
-			candidates.append(os.path.join(entry_path, filename))
-
-	for entry in os.listdir(script_dir):
-		entry_path = os.path.join(script_dir, entry)
-		if os.path.isdir(entry_path):
-			candidates.append(os.path.join(entry_path, filename))
+	# scandir entries carry their file type, so is_dir() rarely needs a stat
+	for search_dir in (cwd, script_dir):
+		with os.scandir(search_dir) as entries:
+			for entry in entries:
+				if entry.is_dir():
+					candidates.append(os.path.join(entry.path, filename))
 
 	seen = set()
 	tried = []
@@ -149,8 +147,8 @@ def get_background_color(image) -> tuple:
 		image.getpixel((width - 1, height - 2)), image.getpixel((width - 2, height - 2))
 	]
 
-	# Find the most frequent color
-	most_common_color = max(set(sample_pixels), key=sample_pixels.count)
+	# Find the most frequent color; ties go to the first sampled corner pixel
+	most_common_color = collections.Counter(sample_pixels).most_common(1)[0][0]
 
 	return most_common_color
 
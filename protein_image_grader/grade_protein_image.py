@@ -184,15 +184,16 @@ def auto_grade_student_response(student_response: str, question_dict: dict) -> t
 		for accepted_answer in accepted_answers:
 			if student_response.startswith(accepted_answer):
 				is_accepted = True
+				# one matching prefix is enough
+				break
 	elif question_dict['type'] == 'ma':
+		# the student's selections do not depend on the accepted answer
+		ascii_student_response = student_response.encode('ascii', 'ignore').decode()
+		student_selections = ascii_student_response.split(';')
 		for accepted_answer in accepted_answers:
 			if is_accepted is True:
-				continue
-			ascii_student_response = student_response.encode('ascii', 'ignore').decode()
-			#print(ascii_student_response)
+				break
 			selected_answers = accepted_answer.split(';')
-			student_selections = ascii_student_response.split(';')
-			#print(student_selections)
 			if len(student_selections) != len(selected_answers):
 				#student selected too many choices
 				is_accepted = False
@@ -253,6 +254,10 @@ def process_csv_question(student_tree: dict, question_dict: dict, accepted_answe
 	correct = 0
 	total = 0
 	q_name = question_dict['name']
+	# per-question column names, built once rather than per student entry
+	status_key = f"{q_name} Status"
+	deduction_key = f"{q_name} Deduction"
+	feedback_key = f"{q_name} Feedback"
 
 	# Loop through the grouped student responses to process each one
 	for student_response, entries in grouped_responses.items():
@@ -261,7 +266,7 @@ def process_csv_question(student_tree: dict, question_dict: dict, accepted_answe
 		# Loop through individual student entries in the current response group
 		for student_entry in entries:
 			# Fetch the pre-existing grading status for the question from the student's response
-			pre_status = student_entry.get(f"{q_name} Status")
+			pre_status = student_entry.get(status_key)
 			# Check if the grading status exists; if not, mark the group as ungraded
 			if pre_status is None:
 				response_is_graded = False
@@ -282,9 +287,9 @@ def process_csv_question(student_tree: dict, question_dict: dict, accepted_answe
 			total += 1
 			if status == "Correct":
 				correct += 1
-			student_entry[f"{q_name} Status"] = status
-			student_entry[f"{q_name} Deduction"] = deduction
-			student_entry[f"{q_name} Feedback"] = feedback
+			student_entry[status_key] = status
+			student_entry[deduction_key] = deduction
+			student_entry[feedback_key] = feedback
 
 	if total > 0:
 		console.print(f"Summary of {q_name}:")
@@ -677,10 +682,8 @@ def _parse_submission_timestamp(row: dict) -> datetime.datetime:
 	Returns:
 		A naive datetime used only for newest-submission comparison.
 	"""
-	timestamp = row["timestamp"]
-	timestamp_without_zone = timestamp[:-4].strip()
-	parsed = datetime.datetime.strptime(timestamp_without_zone,
-		"%Y/%m/%d %I:%M:%S %p")
+	# shared cached parser; check_due_date reads the same timestamps later
+	parsed = timestamp_tools.parse_form_timestamp(row["timestamp"])
 	return parsed
 
 
@@ -700,16 +703,18 @@ def _collapse_form_to_newest_submissions(form_tree: list) -> list:
 	Returns:
 		A form tree with at most one row per Student ID.
 	"""
+	# Dict insertion order keeps each student's first-seen position, even
+	# when a newer row later replaces the stored entry.
 	entries_by_student: dict = {}
-	order: list = []
 	for index, row in enumerate(form_tree):
 		key = grade_status.student_key(row)
 		parsed_timestamp = _parse_submission_timestamp(row)
 		if key not in entries_by_student:
 			entries_by_student[key] = (index, parsed_timestamp, row)
-			order.append(key)
 			continue
-		old_index, old_timestamp, old_row = entries_by_student[key]
+		old_entry = entries_by_student[key]
+		old_index = old_entry[0]
+		old_timestamp = old_entry[1]
 		if parsed_timestamp > old_timestamp:
 			print(
 				f"WARNING: duplicate Student ID {key!r} in form CSV at "
@@ -722,8 +727,7 @@ def _collapse_form_to_newest_submissions(form_tree: list) -> list:
 				f"rows {old_index} and {index}; keeping newer row "
 				f"{old_index}."
 			)
-			entries_by_student[key] = (old_index, old_timestamp, old_row)
-	collapsed_tree = [entries_by_student[key][2] for key in order]
+	collapsed_tree = [entry[2] for entry in entries_by_student.values()]
 	return collapsed_tree
 
 
@@ -832,8 +836,7 @@ def _merge_yaml_into_form(form_tree: list, yaml_tree: list) -> list:
 			# in from the form row. Existing YAML values (cached
 			# hashes, statuses, deductions) are never overwritten.
 			for form_key, form_value in form_row.items():
-				if form_key not in merged_row:
-					merged_row[form_key] = form_value
+				merged_row.setdefault(form_key, form_value)
 			merged_tree.append(merged_row)
 			consumed_yaml_keys.add(key)
 		else:
@@ -30,10 +30,9 @@ def build_raw_image_filename(ruid: int, image_number: int,
 	"""
 	# normalize the original filename to lowercase before splitting
 	filename = original_filename.lower()
-	basename = os.path.splitext(filename)[0]
+	basename, extension = os.path.splitext(filename)
 	# strip spaces and non-ASCII via the shared cleanName helper
 	basename = protein_image_grader.rmspaces.cleanName(basename)
-	extension = os.path.splitext(filename)[-1]
 	# assemble the canonical shape; downloader and grader both call this
 	result = f"{ruid}-protein{image_number:02d}-{basename}{extension}"
 	# coerce unknown extensions to .jpg so downstream PIL.open never trips
@@ -189,6 +189,8 @@ def read_and_save_student_images(student_tree: list, params: dict) -> None:
 	image_hashes_yaml = params.get('image_hashes_yaml')
 	image_hashes = load_image_hashes(image_hashes_yaml)
 	hashes_changed = False
+	# archive folder is the same for every student, look it up once
+	archive_dir = params.get('archive_assignment_dir')
 
 	skip_count = 0
 	processed_count = 0
@@ -198,7 +200,6 @@ def read_and_save_student_images(student_tree: list, params: dict) -> None:
 			output_filename = student_entry.get('Output Filename')
 			archive_image_if_needed(output_filename, params)
 			if output_filename:
-				archive_dir = params.get('archive_assignment_dir')
 				archive_path = None
 				if archive_dir:
 					archive_path = os.path.join(archive_dir, os.path.basename(output_filename))
@@ -224,7 +225,6 @@ def read_and_save_student_images(student_tree: list, params: dict) -> None:
 				or not os.path.exists(image_dict['output_filename'])):
 			save_image(image_dict, image_dict['output_filename'])
 		archive_image_if_needed(image_dict['output_filename'], params)
-		archive_dir = params.get('archive_assignment_dir')
 		archive_path = None
 		if archive_dir:
 			archive_path = os.path.join(archive_dir, os.path.basename(image_dict['output_filename']))
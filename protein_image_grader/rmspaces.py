@@ -13,6 +13,35 @@ import unicodedata
 # PIP3 modules
 import transliterate
 
+# cleanName runs once per downloaded image, so its fixed patterns are compiled once here
+_PAREN_NUMBER_SUFFIX_RE = re.compile(r"\((\d+)\)(\.[a-zA-Z0-9]+)?$")
+_PAREN_NUMBER_RE = re.compile(r"\s*\(\d+\)")
+_WWW_PREFIX_RE = re.compile(r"[Ww]{3}\.")
+_DOT_UNDERSCORE_DOT_RE = re.compile(r"\._\.")
+_UNDERSCORE_DOT_UNDERSCORE_RE = re.compile(r"_\._")
+_DASH_UNDERSCORE_DASH_RE = re.compile(r"-_-")
+_UNDERSCORE_DASH_UNDERSCORE_RE = re.compile(r"_-_")
+_DOUBLE_DOT_RE = re.compile(r"\.\.")
+_UNDERSCORE_DOT_RE = re.compile(r"_\.")
+_DOT_UNDERSCORE_RE = re.compile(r"\._")
+_DASH_UNDERSCORE_RE = re.compile(r"-_")
+_UNDERSCORE_DASH_RE = re.compile(r"_-")
+_UNDERSCORE_RUN_RE = re.compile(r"__*")
+_TRAILING_UNDERSCORES_RE = re.compile(r"_*$")
+_LEADING_UNDERSCORES_RE = re.compile(r"^_*")
+_LEADING_DASHES_RE = re.compile(r"^-*")
+_LEADING_DOTS_RE = re.compile(r"^\.*")
+# Words to preserve or format correctly, paired with their case-insensitive patterns
+_CASE_WORDS = ['of', 'the', 'a', 'in', 'for', 'am', 'is', 'on',
+		'la', 'to', 'than', 'with', 'by', 'from', 'or', 'and']
+_CASE_WORD_PATTERNS = [
+	(word, re.compile(r"_(" + word + ")_", re.IGNORECASE)) for word in _CASE_WORDS
+]
+# Allowed characters are -./_ plus ASCII letters and digits
+_DISALLOWED_CHAR_RE = re.compile(r"[^-./_0-9A-Za-z]")
+# quotes and brackets become underscores and ampersands are spelled out, in one pass
+_PUNCTUATION_TABLE = str.maketrans({"'": "_", '"': "_", "&": "and", "]": "_", "[": "_"})
+
 #==============
 def unicode_to_string(data: str) -> str:
 	"""
@@ -23,6 +52,11 @@ def unicode_to_string(data: str) -> str:
 	if isinstance(data, bytes):
 		data = data.decode("utf-8")
 
+	# Pure-ASCII input is already the answer: no language detection matches ASCII
+	# letters and NFKD leaves ASCII unchanged, so skip the whole round-trip
+	if data.isascii():
+		return data
+
 	# Attempt transliteration; transliterate raises on unsupported scripts,
 	# so fall back to the original string in that case (kept narrow, two lines).
 	try:
@@ -30,8 +64,15 @@ def unicode_to_string(data: str) -> str:
 	except transliterate.exceptions.LanguageDetectionError:
 		transliterated = data
 
-	# Normalize the string to decompose accents and diacritics (NFKD normalization)
-	nfkd_form = unicodedata.normalize('NFKD', transliterated)
+	# Cyrillic and Greek names usually transliterate to plain ASCII
+	if transliterated.isascii():
+		return transliterated
+
+	# Normalize the string to decompose accents and diacritics (NFKD normalization);
+	# the quick check is cheaper than rebuilding an already decomposed string
+	nfkd_form = transliterated
+	if not unicodedata.is_normalized('NFKD', transliterated):
+		nfkd_form = unicodedata.normalize('NFKD', transliterated)
 
 	# Remove non-ASCII characters by encoding to ASCII and ignoring errors
 	ascii_bytes = nfkd_form.encode('ASCII', 'ignore')
@@ -42,28 +83,18 @@ def unicode_to_string(data: str) -> str:
 
 #=======================
 def cleanName(f: str) -> str:
-	# Words to preserve or format correctly
-	words = ['of', 'the', 'a', 'in', 'for', 'am', 'is', 'on',
-			'la', 'to', 'than', 'with', 'by', 'from', 'or', 'and']
-
-	# Allowed characters
-	goodchars = list('-./_'
-					+ '0123456789'
-					+ 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-					+ 'abcdefghijklmnopqrstuvwxyz')
-
 	# Transliterate filename to ASCII
 	g = unicode_to_string(f)
 	g = g.strip()
 
 	# Handle filenames with numbers in parentheses at the end
 	# Find "(number)" + optional extension
-	match = re.search(r"\((\d+)\)(\.[a-zA-Z0-9]+)?$", g)
+	match = _PAREN_NUMBER_SUFFIX_RE.search(g)
 	if match:
 		number = int(match.group(1))
 		extension = match.group(2) if match.group(2) else ""
 		# Remove the "(number)" part and append in zero-padded form
-		g = re.sub(r"\s*\(\d+\)", "", g)
+		g = _PAREN_NUMBER_RE.sub("", g)
 		g += f"_{number:04d}{extension}"
 
 	# Preserve file extension casing when the input names a real file on disk
@@ -71,60 +102,46 @@ def cleanName(f: str) -> str:
 		g = g[:-4] + g[-4:].lower()
 
 	# Replace spaces and unwanted patterns
-	g = re.sub(" ", "_", g)
-	g = re.sub(r"[Ww]{3}\.", "", g)
-	g = re.sub(r"\._\.", "_", g)
-	g = re.sub(r"^-*", "", g)
-	g = re.sub(r"\'", "_", g)
-	g = re.sub(r"\"", "_", g)
-	g = re.sub(r"&", "and", g)
-	g = re.sub(r"\]", "_", g)
-	g = re.sub(r"\[", "_", g)
+	g = g.replace(" ", "_")
+	g = _WWW_PREFIX_RE.sub("", g)
+	g = _DOT_UNDERSCORE_DOT_RE.sub("_", g)
+	g = _LEADING_DASHES_RE.sub("", g)
+	g = g.translate(_PUNCTUATION_TABLE)
 
 	# Replace all other non-allowed characters with underscores
-	newg = ""
-	for char in g:
-		if char not in goodchars:
-			newg += "_"
-		else:
-			newg += char
-	if newg:
-		g = newg
+	g = _DISALLOWED_CHAR_RE.sub("_", g)
 
 	# Normalize case for specific words
-	for word in words:
-		a = re.search(r"_(" + word + ")_", g, re.IGNORECASE)
+	for word, word_re in _CASE_WORD_PATTERNS:
+		a = word_re.search(g)
 		if a:
 			for inword in a.groups():
-				g = re.sub(r"_" + inword + "_", "_" + word + "_", g)
+				# inword is letters only, so a literal replace matches the old re.sub
+				g = g.replace("_" + inword + "_", "_" + word + "_")
 
 	# Fix patterns: triples, doubles, and odd characters
 	## triples
-	g = re.sub(r"_\._", ".", g)
-	g = re.sub(r"\._\.", "_", g)
-	g = re.sub(r"-_-", "_", g)
-	g = re.sub(r"_-_", "-", g)
+	g = _UNDERSCORE_DOT_UNDERSCORE_RE.sub(".", g)
+	g = _DOT_UNDERSCORE_DOT_RE.sub("_", g)
+	g = _DASH_UNDERSCORE_DASH_RE.sub("_", g)
+	g = _UNDERSCORE_DASH_UNDERSCORE_RE.sub("-", g)
 	## doubles
-	g = re.sub(r"\.\.", ".", g)
-	g = re.sub(r"_\.", ".", g)
-	g = re.sub(r"\._", ".", g)
-	g = re.sub(r"-_", "", g)
-	g = re.sub(r"_-", "-", g)
-	## strange chars
-	g = re.sub(r"\^", "_", g)
-	g = re.sub(r",", "_", g)
-	## rm extra underscore
-	g = re.sub(r"__*", "_", g)
-	g = re.sub(r"__*", "_", g)
+	g = _DOUBLE_DOT_RE.sub(".", g)
+	g = _UNDERSCORE_DOT_RE.sub(".", g)
+	g = _DOT_UNDERSCORE_RE.sub(".", g)
+	g = _DASH_UNDERSCORE_RE.sub("", g)
+	g = _UNDERSCORE_DASH_RE.sub("-", g)
+	## rm extra underscore; "^" and "," were already turned into "_" by
+	## _DISALLOWED_CHAR_RE, and one pass collapses every run
+	g = _UNDERSCORE_RUN_RE.sub("_", g)
 	## ends and starts
-	g = re.sub(r"_*$", "", g)
-	g = re.sub(r"^_*", "", g)
-	g = re.sub(r"^-*", "", g)
-	g = re.sub(r"^\.*", "", g)
+	g = _TRAILING_UNDERSCORES_RE.sub("", g)
+	g = _LEADING_UNDERSCORES_RE.sub("", g)
+	g = _LEADING_DASHES_RE.sub("", g)
+	g = _LEADING_DOTS_RE.sub("", g)
 
 	# Ensure cleaned filename is valid
 	if len(g) == 0:
 		raise ValueError(f"cleanName produced an empty filename for input '{f}'")
-	g = re.sub("_*$", "", g)
 
 	return g
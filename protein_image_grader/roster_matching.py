@@ -2,6 +2,9 @@
 import argparse
 import csv
 import difflib
+import functools
+import heapq
+import operator
 import os
 import re
 import unicodedata
@@ -9,6 +12,22 @@ import unicodedata
 # PIP3 modules
 import unidecode
 
+# Fixed name-cleanup patterns, compiled once for every roster and submission name
+_PARENTHETICAL_RE = re.compile(r"\(.*\)")
+_POSSESSIVE_RE = re.compile(r"\'s($|\s)")
+_DEVICE_NAME_RE = re.compile(r"\s*(iphone|ipad)\s*")
+_NAME_DISALLOWED_RE = re.compile(r"[^a-z0-9\- ]")
+# Username and student ID patterns used per roster row and per submission
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+_TRAILING_DIGITS_RE = re.compile(r"[0-9]+$")
+_NON_LOGIN_CHAR_RE = re.compile(r"[^a-z0-9._-]")
+# Roster column aliases for each field, most preferred first
+ROSTER_ID_COLUMNS = ("Student ID", "StudentID")
+ROSTER_FIRST_COLUMNS = ("First Name", "First")
+ROSTER_LAST_COLUMNS = ("Last Name", "Last")
+ROSTER_USERNAME_COLUMNS = ("Username",)
+ROSTER_ALIAS_COLUMNS = ("Alias", "Phonetic", "Preferred")
+
 
 #============================================
 def ansi_wrap(text: str, code: str) -> str:
@@ -99,44 +118,58 @@ def detect_delimiter(path: str) -> str:
 	return ","
 
 
+#============================================
+def build_column_index_ci(header: list[str]) -> dict[str, int]:
+	"""Map each case-folded column name to its first index in header."""
+	column_index: dict[str, int] = {}
+	for i, name in enumerate(header):
+		# setdefault keeps the first match when a header name repeats
+		column_index.setdefault(name.strip().lower(), i)
+	return column_index
+
+
 #============================================
 def find_column_ci(header: list[str], target: str) -> int | None:
 	"""Find a column name case-insensitively."""
-	needle = target.strip().lower()
-	for i, name in enumerate(header):
-		if name.strip().lower() == needle:
-			return i
-	return None
+	column_index = build_column_index_ci(header)
+	column = column_index.get(target.strip().lower())
+	return column
 
 
 #============================================
+# the same roster and submission names are normalized again for every candidate
+@functools.lru_cache(maxsize=4096)
 def normalize_name_text(name_text: str) -> str:
 	"""Normalize a human name for matching."""
 	text = (name_text or "").strip().lower()
 	text = unicodedata.normalize("NFKC", text)
 	text = unidecode.unidecode(text)
-	text = re.sub(r"\(.*\)", "", text).strip()
-	text = re.sub(r"\'s($|\s)", r"\1", text).strip()
-	text = re.sub(r"\s*(iphone|ipad)\s*", " ", text)
-	text = re.sub(r"[^a-z0-9\- ]", "", text)
-	text = re.sub(r"\s+", " ", text).strip()
+	text = _PARENTHETICAL_RE.sub("", text).strip()
+	text = _POSSESSIVE_RE.sub(r"\1", text).strip()
+	text = _DEVICE_NAME_RE.sub(" ", text)
+	text = _NAME_DISALLOWED_RE.sub("", text)
+	# split/join collapses whitespace runs and trims both ends without a regex pass
+	text = " ".join(text.split())
 	return text
 
 
 #============================================
+# usernames repeat across roster indexing and every candidate score
+@functools.lru_cache(maxsize=4096)
 def normalize_username(username_text: str) -> str:
 	"""Normalize a username or email for matching."""
 	text = (username_text or "").strip().lower()
 	text = unicodedata.normalize("NFKC", text)
 	text = unidecode.unidecode(text)
-	text = re.sub(r"\s+", "", text)
+	# str.split() drops every whitespace run in C, no regex pass needed
+	text = "".join(text.split())
 	return text
 
 
 #============================================
 def safe_int(text: str) -> int | None:
 	"""Parse an int-like string, returning None when empty or invalid."""
-	clean = re.sub(r"[^0-9]", "", (text or "").strip())
+	clean = _NON_DIGIT_RE.sub("", (text or "").strip())
 	if not clean:
 		return None
 	try:
@@ -146,24 +179,54 @@ def safe_int(text: str) -> int | None:
 	return value
 
 
+#============================================
+def _first_roster_cell(row: list[str], indexes: list[int]) -> str:
+	"""Return the first non-empty cell among alias column indexes."""
+	for index in indexes:
+		if index < len(row) and row[index]:
+			return row[index]
+	return ""
+
+
+#============================================
+def first_record_value(record: dict, names: tuple) -> object:
+	"""Return the first truthy value among alias keys, else the last lookup."""
+	value = ""
+	for name in names:
+		value = record.get(name, "")
+		if value:
+			break
+	return value
+
+
 #============================================
 def read_roster(roster_csv: str) -> dict[int, dict]:
 	"""Read a roster CSV into a dict keyed by Student ID."""
 	delimiter = detect_delimiter(roster_csv)
+	roster: dict[int, dict] = {}
 	with open(roster_csv, "r", encoding="utf-8-sig", newline="") as f:
-		reader = csv.DictReader(f, delimiter=delimiter)
-		roster: dict[int, dict] = {}
+		reader = csv.reader(f, delimiter=delimiter)
+		# The first row is the header, exactly as csv.DictReader takes it
+		header = next(reader, None)
+		if header is None:
+			return roster
+		# Resolve each field's alias columns to positions once; a later
+		# duplicate header wins, as it did with DictReader.
+		column_index = {name: i for i, name in enumerate(header)}
+		id_cols = [column_index[n] for n in ROSTER_ID_COLUMNS if n in column_index]
+		first_cols = [column_index[n] for n in ROSTER_FIRST_COLUMNS if n in column_index]
+		last_cols = [column_index[n] for n in ROSTER_LAST_COLUMNS if n in column_index]
+		user_cols = [column_index[n] for n in ROSTER_USERNAME_COLUMNS if n in column_index]
+		alias_cols = [column_index[n] for n in ROSTER_ALIAS_COLUMNS if n in column_index]
 		for row in reader:
-			student_id = safe_int(row.get("Student ID", "") or row.get("StudentID", ""))
+			student_id = safe_int(_first_roster_cell(row, id_cols))
 			if student_id is None:
 				continue
 
-			first_name = normalize_name_text(row.get("First Name", "") or row.get("First", ""))
-			last_name = normalize_name_text(row.get("Last Name", "") or row.get("Last", ""))
-			username = normalize_username(row.get("Username", ""))
-			alias = normalize_name_text(
-				row.get("Alias", "") or row.get("Phonetic", "") or row.get("Preferred", "")
-			)
+			first_name = normalize_name_text(_first_roster_cell(row, first_cols))
+			last_name = normalize_name_text(_first_roster_cell(row, last_cols))
+			username = normalize_username(_first_roster_cell(row, user_cols))
+			alias = normalize_name_text(_first_roster_cell(row, alias_cols))
 
 			roster[int(student_id)] = {
 				"student_id": int(student_id),
@@ -193,6 +256,7 @@ def build_roster_indexes(roster: dict[int, dict]) -> dict:
 	by_name: dict[str, list[int]] = {}
 	by_first_unique: dict[str, int] = {}
 	first_counts: dict[str, int] = {}
+	first_owner: dict[str, int] = {}
 
 	for student_id, info in roster.items():
 		username = normalize_username(info.get("username", ""))
@@ -201,7 +265,7 @@ def build_roster_indexes(roster: dict[int, dict]) -> dict:
 			if "@" in username:
 				by_username[username.split("@", 1)[0]] = int(student_id)
 			local = username.split("@", 1)[0]
-			local_nodigits = re.sub(r"[0-9]+$", "", local)
+			local_nodigits = _TRAILING_DIGITS_RE.sub("", local)
 			if local_nodigits:
 				by_username[local_nodigits] = int(student_id)
 
@@ -227,13 +291,12 @@ def build_roster_indexes(roster: dict[int, dict]) -> dict:
 
 		if first_name:
 			first_counts[first_name] = first_counts.get(first_name, 0) + 1
+			first_owner.setdefault(first_name, int(student_id))
 
-	for student_id, info in roster.items():
-		first_name = normalize_name_text(info.get("first_name", ""))
-		if not first_name:
-			continue
-		if first_counts.get(first_name, 0) == 1:
-			by_first_unique[first_name] = int(student_id)
+	# a first name seen exactly once keeps its only owner, no second roster pass
+	for first_name, student_id in first_owner.items():
+		if first_counts[first_name] == 1:
+			by_first_unique[first_name] = student_id
 
 	return {
 		"by_username": by_username,
@@ -333,10 +396,12 @@ def match_rows_to_roster(
 		col_student_id: str = "Enter your RUID",
 	) -> tuple[list[str], list[list[str]], dict]:
 	"""Match many rows and return (out_header, out_rows, summary)."""
-	idx_user = find_column_ci(header, col_username)
-	idx_first = find_column_ci(header, col_first)
-	idx_last = find_column_ci(header, col_last)
-	idx_id = find_column_ci(header, col_student_id)
+	# Fold the header once instead of rescanning it for each requested column
+	column_index = build_column_index_ci(header)
+	idx_user = column_index.get(col_username.strip().lower())
+	idx_first = column_index.get(col_first.strip().lower())
+	idx_last = column_index.get(col_last.strip().lower())
+	idx_id = column_index.get(col_student_id.strip().lower())
 
 	if idx_user is None and idx_first is None and idx_last is None and idx_id is None:
 		raise ValueError("Could not find any requested submission columns in the input header")
@@ -388,6 +453,9 @@ def similarity(a: str, b: str) -> float:
 	"""Return a similarity score in [0, 1] using difflib ratio."""
 	if not a and not b:
 		return 0.0
+	# identical names are common (exact roster hits) and always score 1.0
+	if a == b:
+		return 1.0
 	return difflib.SequenceMatcher(a=a, b=b).ratio()
 
 #============================================
@@ -400,18 +468,22 @@ def looks_like_username_or_email(text: str) -> bool:
 		return True
 	if " " in value:
 		return False
-	if re.search(r"[^a-z0-9._-]", value.lower()):
+	if _NON_LOGIN_CHAR_RE.search(value.lower()):
 		return False
 	return True
 
 
 #============================================
-def score_candidate(sub: dict, roster_row: dict) -> float:
-	"""Compute a combined score for a submission against a roster row."""
+def normalize_submission(sub: dict) -> dict:
+	"""Normalize the submission fields that score_normalized_candidate compares.
+
+	The result depends only on the submission, so rank_candidates computes
+	it once per submission; score_candidate is the one-row convenience form.
+	"""
 	sub_user = normalize_username(sub.get("username", ""))
 	if "@" in sub_user:
 		sub_user = sub_user.split("@", 1)[0]
-	sub_user_nodigits = re.sub(r"[0-9]+$", "", sub_user)
+	sub_user_nodigits = _TRAILING_DIGITS_RE.sub("", sub_user)
 
 	sub_first = normalize_name_text(sub.get("first_name", ""))
 	sub_last = normalize_name_text(sub.get("last_name", ""))
@@ -419,6 +491,35 @@ def score_candidate(sub: dict, roster_row: dict) -> float:
 	sub_name_for_alias = sub_full if sub_full else sub_first
 	sub_first_token = sub_name_for_alias.split(" ", 1)[0] if sub_name_for_alias else ""
 
+	sub_norm = {
+		"user": sub_user,
+		"user_nodigits": sub_user_nodigits,
+		"last": sub_last,
+		"full": sub_full,
+		"name_for_alias": sub_name_for_alias,
+		"first_token": sub_first_token,
+		"user_is_login": looks_like_username_or_email(sub.get("username", "")),
+	}
+	return sub_norm
+
+
+#============================================
+def score_candidate(sub: dict, roster_row: dict) -> float:
+	"""Compute a combined score for a submission against a roster row."""
+	score = score_normalized_candidate(normalize_submission(sub), roster_row)
+	return score
+
+
+#============================================
+def score_normalized_candidate(sub_norm: dict, roster_row: dict) -> float:
+	"""Score a normalize_submission() result against a roster row."""
+	sub_user = sub_norm["user"]
+	sub_user_nodigits = sub_norm["user_nodigits"]
+	sub_last = sub_norm["last"]
+	sub_full = sub_norm["full"]
+	sub_name_for_alias = sub_norm["name_for_alias"]
+	sub_first_token = sub_norm["first_token"]
+
 	ro_user = normalize_username(roster_row.get("username", ""))
 	ro_full = normalize_name_text(roster_row.get("full_name", ""))
 	ro_last = normalize_name_text(roster_row.get("last_name", ""))
@@ -430,9 +531,15 @@ def score_candidate(sub: dict, roster_row: dict) -> float:
 	alias_score = 0.0
 	if ro_alias:
 		alias_full = similarity(sub_name_for_alias, ro_alias) if sub_name_for_alias else 0.0
-		alias_token = similarity(sub_first_token, ro_alias_token) if sub_first_token and ro_alias_token else 0.0
-		if len(sub_first_token) < 4 or len(ro_alias_token) < 4:
-			alias_token = 0.0
+		# token matches under 4 letters or 0.80 are dropped, so skip the
+		# ratio when either token is short or the lengths alone cap the
+		# ratio (2*min/(la+lb), the difflib real_quick_ratio) below 0.80
+		alias_token = 0.0
+		token_len_a = len(sub_first_token)
+		token_len_b = len(ro_alias_token)
+		if min(token_len_a, token_len_b) >= 4:
+			if 2.0 * min(token_len_a, token_len_b) / (token_len_a + token_len_b) >= 0.80:
+				alias_token = similarity(sub_first_token, ro_alias_token)
 		if alias_token < 0.80:
 			alias_token = 0.0
 		alias_score = max(alias_full, alias_token)
@@ -445,7 +552,7 @@ def score_candidate(sub: dict, roster_row: dict) -> float:
 	if not sub_full:
 		return user_score
 
-	use_user = looks_like_username_or_email(sub.get("username", "")) and bool(sub_user) and bool(ro_user)
+	use_user = sub_norm["user_is_login"] and bool(sub_user) and bool(ro_user)
 	use_last = bool(sub_last) and bool(ro_last)
 
 	weights: dict[str, float] = {"name": 0.70}
@@ -469,14 +576,18 @@ def score_candidate(sub: dict, roster_row: dict) -> float:
 #============================================
 def rank_candidates(sub: dict, roster: dict[int, dict], limit: int) -> list[tuple[int, float]]:
 	"""Rank roster candidates for a submission."""
+	# Normalize the submission once, not once per roster row
+	sub_norm = normalize_submission(sub)
 	items: list[tuple[int, float]] = []
 	for student_id, row in roster.items():
-		score = score_candidate(sub, row)
+		score = score_normalized_candidate(sub_norm, row)
 		if score <= 0.0:
 			continue
 		items.append((int(student_id), score))
-	items.sort(key=lambda x: x[1], reverse=True)
-	return items[:limit]
+	# only the top few are shown, so skip sorting the whole roster;
+	# nlargest keeps roster order for ties, same as a stable sort
+	top_candidates = heapq.nlargest(limit, items, key=operator.itemgetter(1))
+	return top_candidates
 
 
 #============================================
@@ -576,7 +687,7 @@ def match_submission(
 			local = sub_user.split("@", 1)[0]
 			if local in by_username:
 				return int(by_username[local]), "email_local", 1.0
-			local_nodigits = re.sub(r"[0-9]+$", "", local)
+			local_nodigits = _TRAILING_DIGITS_RE.sub("", local)
 			if local_nodigits in by_username:
 				return int(by_username[local_nodigits]), "email_local_nodigits", 1.0
 
@@ -617,9 +617,9 @@ def render_footer_warnings(term: str, rows: list = None) -> str:
 	dups = detect_canonical_duplicates(term)
 	if dups:
 		dup_lines = ["DUPLICATE form CSVs detected (resolve before grading):"]
-		for image_number, paths in sorted(dups.items()):
+		for image_number in sorted(dups):
 			dup_lines.append(f"  image {image_number:02d}:")
-			for p in paths:
+			for p in dups[image_number]:
 				dup_lines.append(f"    {p}")
 		parts.append("\n".join(dup_lines))
 	if not parts:
@@ -19,6 +19,9 @@ data_color = rich.style.Style(color="rgb(187, 51, 255)" )  # RGB for purple
 student_style = rich.style.Style(color="blue", bold=True, italic=True)
 validation_color = rich.style.Style(color="rgb(153, 230, 76)" )  # RGB for lime-ish green
 
+# String answers are compared on lowercase letters and digits only
+_NON_ALNUM_RE = re.compile('[^a-z0-9]')
+
 validation_types = {
 	'a': 'almost',
 	'b': 'bonus',
@@ -165,19 +168,19 @@ def group_student_responses(student_tree: list, question_dict: dict) -> collecti
 	# Get the key for this question's answer
 	response_key = question_dict['name']
 
+	# Identify the expected data type for the answer, same for every student
+	answer_type = question_dict["type"]
+
 	# Iterate over each student's entry in the student_tree
 	for student_entry in student_tree:
 		# Extract the given answer for the question from the student's entry
 		given_answer = student_entry[response_key]
 
-		# Identify the expected data type for the answer, defaulting to an empty string
-		answer_type = question_dict["type"]
-
 		# Process the answer based on its type
 		if answer_type == "str":
 			# Convert to lowercase and remove non-alphanumeric characters for string answers
 			processed_answer = given_answer.lower()
-			processed_answer = re.sub('[^a-z0-9]', '', processed_answer)
+			processed_answer = _NON_ALNUM_RE.sub('', processed_answer)
 		elif answer_type == "int":
 			# Convert to integer for int type answers
 			try:
@@ -256,14 +259,22 @@ def build_roster_from_student_ids_tree(student_ids_tree: list) -> dict:
 	"""
 	roster: dict[int, dict] = {}
 	for row in student_ids_tree:
-		student_id = roster_matching.safe_int(row.get("Student ID", "") or row.get("StudentID", ""))
+		student_id = roster_matching.safe_int(
+			roster_matching.first_record_value(row, roster_matching.ROSTER_ID_COLUMNS)
+		)
 		if student_id is None:
 			continue
-		first_name = roster_matching.normalize_name_text(row.get("First Name", "") or row.get("First", ""))
-		last_name = roster_matching.normalize_name_text(row.get("Last Name", "") or row.get("Last", ""))
-		username = roster_matching.normalize_username(row.get("Username", ""))
+		first_name = roster_matching.normalize_name_text(
+			roster_matching.first_record_value(row, roster_matching.ROSTER_FIRST_COLUMNS)
+		)
+		last_name = roster_matching.normalize_name_text(
+			roster_matching.first_record_value(row, roster_matching.ROSTER_LAST_COLUMNS)
+		)
+		username = roster_matching.normalize_username(
+			roster_matching.first_record_value(row, roster_matching.ROSTER_USERNAME_COLUMNS)
+		)
 		alias = roster_matching.normalize_name_text(
-			row.get("Alias", "") or row.get("Phonetic", "") or row.get("Preferred", "")
+			roster_matching.first_record_value(row, roster_matching.ROSTER_ALIAS_COLUMNS)
 		)
 		roster[int(student_id)] = {
 			"student_id": int(student_id),
@@ -1,6 +1,42 @@
 """Helpers for due-date deductions and timestamp parsing."""
 
 import datetime
+import functools
+
+#==========================================
+@functools.lru_cache(maxsize=256)
+def _parse_range_key(key: str) -> tuple:
+	"""
+	Parse a 'lower_limit-upper_limit' deduction key into numeric limits.
+
+	Range keys come from the spec YAML and repeat for every student, so
+	each distinct key string is parsed once.
+
+	Parameters
+	----------
+	key : str
+		Range key; an empty side means unbounded ('-5', '10-').
+
+	Returns
+	-------
+	tuple
+		(lower_limit, upper_limit) with infinities for open ends.
+	"""
+	# Split the key to get the lower and upper limits of the range
+	lower_limit, upper_limit = key.split("-")
+
+	# Handle the "+" symbol by replacing with positive infinity
+	if len(upper_limit) == 0:
+		upper_limit = float('inf')
+	else:
+		upper_limit = int(upper_limit)
+
+	# Handle the "-" symbol by replacing with negative infinity
+	if len(lower_limit) == 0:
+		lower_limit = float('-inf')
+	else:
+		lower_limit = int(lower_limit)
+	return lower_limit, upper_limit
 
 #==========================================
 # Helper function to determine the deduction based on a given value and ranges
@@ -26,20 +62,8 @@ def get_deduction(value: int, ranges: dict) -> int | float:
 	# Iterate over the ranges dictionary to find the correct range for the value
 	for key, deduction in ranges.items():
 
-		# Split the key to get the lower and upper limits of the range
-		lower_limit, upper_limit = key.split("-")
-
-		# Handle the "+" symbol by replacing with positive infinity
-		if len(upper_limit) == 0:
-			upper_limit = float('inf')
-		else:
-			upper_limit = int(upper_limit)
-
-		# Handle the "-" symbol by replacing with negative infinity
-		if len(lower_limit) == 0:
-			lower_limit = float('-inf')
-		else:
-			lower_limit = int(lower_limit)
+		# Look up the parsed lower and upper limits of the range
+		lower_limit, upper_limit = _parse_range_key(key)
 
 		# Check if the value lies within the current range
 		if lower_limit <= value <= upper_limit:
@@ -48,6 +72,55 @@ def get_deduction(value: int, ranges: dict) -> int | float:
 	# Return 0 if value doesn't fall within any of the defined ranges
 	return 0
 
+#==========================================
+@functools.lru_cache(maxsize=1024)
+def parse_form_timestamp(entry_timestamp: str) -> datetime.datetime:
+	"""
+	Parse a Google Forms timestamp such as '2024/09/05 3:14:15 PM EST'.
+
+	The same row timestamp is read both when picking the newest
+	submission and when checking the due date, so each string is
+	parsed once. The trailing timezone abbreviation is dropped.
+
+	Parameters
+	----------
+	entry_timestamp : str
+		Raw form timestamp with a trailing timezone abbreviation.
+
+	Returns
+	-------
+	datetime.datetime
+		Naive datetime of the submission.
+	"""
+	parsed = datetime.datetime.strptime(entry_timestamp[:-4].strip(), "%Y/%m/%d %I:%M:%S %p")
+	return parsed
+
+#==========================================
+@functools.lru_cache(maxsize=64)
+def _parse_due_date(due_date_str: str) -> datetime.datetime:
+	"""
+	Parse a spec YAML due date such as 'Sep 5, 2024 11:59:59 PM'.
+
+	The due date is the same for every student of an assignment, so it
+	is parsed once. Abbreviated month names are tried first, then full
+	month names ('September 5, 2024 ...').
+
+	Parameters
+	----------
+	due_date_str : str
+		Due date with the end-of-day time already appended.
+
+	Returns
+	-------
+	datetime.datetime
+		Naive datetime of the deadline.
+	"""
+	try:
+		due_date = datetime.datetime.strptime(due_date_str, "%b %d, %Y %I:%M:%S %p")
+	except ValueError:
+		due_date = datetime.datetime.strptime(due_date_str, "%B %d, %Y %I:%M:%S %p")
+	return due_date
+
 #==========================================
 def timestamp_due_date(student_entry: dict, config: dict) -> None:
 	"""
@@ -104,11 +177,8 @@ def check_due_date(entry_timestamp: str, config: dict) -> tuple:
 	due_date_str = config["deadline"]["due date"] + " 11:59:59 PM"
 
 	# Convert due_date and entry_timestamp to datetime objects
-	try:
-		due_date = datetime.datetime.strptime(due_date_str, "%b %d, %Y %I:%M:%S %p")
-	except ValueError:
-		due_date = datetime.datetime.strptime(due_date_str, "%B %d, %Y %I:%M:%S %p")
-	entry_datetime = datetime.datetime.strptime(entry_timestamp[:-4].strip(), "%Y/%m/%d %I:%M:%S %p")
+	due_date = _parse_due_date(due_date_str)
+	entry_datetime = parse_form_timestamp(entry_timestamp)
 
 	# Calculate the difference in hours between due_date and entry_datetime
 	hours_diff = (entry_datetime - due_date).total_seconds() / 3600
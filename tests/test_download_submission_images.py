@@ -830,3 +830,20 @@ def test_assigned_ruids_reset_per_csv_in_one_run(monkeypatch, tmp_path):
 	)
 	assert isinstance(second, rr.ResolvedStudent)
 	assert second.roster_ruid == 900000002
+
+
+def test_first_name_column_preferred_over_earlier_full_name():
+	header = ["Timestamp", "Full Name", "Enter your first name", "Enter your last name"]
+	index = dsi.find_first_name_key_index_from_header(header)
+	assert index == 2
+
+
+def test_full_name_column_used_when_no_first_name():
+	header = ["Timestamp", "Your full name", "Student ID"]
+	index = dsi.find_first_name_key_index_from_header(header)
+	assert index == 1
+
+
+def test_extract_number_in_range_skips_out_of_range_numbers():
+	assert dsi.extract_number_in_range("BCHM_Prot_Img_05-Foo.csv") == 5
+	assert dsi.extract_number_in_range("form 99 image 7") == 7
@@ -0,0 +1,62 @@
+# local repo modules
+import protein_image_grader.duplicate_processing as duplicate_processing
+
+
+#============================================
+def test_index_students_by_filename_keeps_first_entry() -> None:
+	"""
+	Check the filename index agrees with the linear lookup.
+	"""
+	student_tree = [
+		{"Output Filename": "DOWNLOAD_a.png", "First Name": "Ana"},
+		{"Output Filename": "DOWNLOAD_b.png", "First Name": "Ben"},
+		{"Output Filename": "DOWNLOAD_a.png", "First Name": "Copy"},
+	]
+	student_by_filename = duplicate_processing.index_students_by_filename(student_tree)
+	for output_filename in ("DOWNLOAD_a.png", "DOWNLOAD_b.png"):
+		expected = duplicate_processing.find_student_entry_by_filename(
+			output_filename, student_tree
+		)
+		assert student_by_filename[output_filename] is expected
+	assert student_by_filename["DOWNLOAD_a.png"]["First Name"] == "Ana"
+
+
+#============================================
+def test_phash_distance_matches_hamming_distance() -> None:
+	"""
+	Check the integer nibble count agrees with the character count.
+	"""
+	phash1 = "0123456789abcdef" * 4
+	phash2 = "0f23456789abcde0" * 4
+	phash_int1 = duplicate_processing.phash_to_int(phash1)
+	phash_int2 = duplicate_processing.phash_to_int(phash2)
+	distance = duplicate_processing.phash_distance(phash1, phash_int1, phash2, phash_int2)
+	assert distance == duplicate_processing.hamming_distance(phash1, phash2) == 8
+
+
+#============================================
+def test_phash_distance_uppercase_falls_back_to_characters() -> None:
+	"""
+	Check non-lowercase phashes keep character comparison semantics.
+	"""
+	assert duplicate_processing.phash_to_int("ABCD") is None
+	distance = duplicate_processing.phash_distance("ABCD", None, "abcd", 43981)
+	assert distance == 4
+
+
+#============================================
+def test_mark_images_as_duplicates_uses_filename_index() -> None:
+	"""
+	Check every student in a duplicate group is flagged and warned.
+	"""
+	student_tree = [
+		{"Output Filename": "DOWNLOAD_a.png", "First Name": "Ana", "Last Name": "Lopez"},
+		{"Output Filename": "DOWNLOAD_b.png", "First Name": "Ben", "Last Name": "Kim"},
+	]
+	student_by_filename = duplicate_processing.index_students_by_filename(student_tree)
+	duplicate_processing.mark_images_as_duplicates(
+		{"DOWNLOAD_a.png", "DOWNLOAD_b.png"}, student_by_filename
+	)
+	for student_entry in student_tree:
+		assert student_entry["Exact Match"] is True
+		assert len(student_entry["Warnings"]) == 1
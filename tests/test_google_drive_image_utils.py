@@ -0,0 +1,15 @@
+# PIP3 modules
+import PIL.Image
+
+# local repo modules
+import protein_image_grader.google_drive_image_utils as google_drive_image_utils
+
+
+#============================================
+def test_get_background_color_majority_corner_color() -> None:
+	"""
+	Check the most common corner color wins over a single odd corner.
+	"""
+	image = PIL.Image.new("RGB", (8, 8), (255, 255, 255))
+	image.putpixel((0, 0), (0, 0, 0))
+	assert google_drive_image_utils.get_background_color(image) == (255, 255, 255)
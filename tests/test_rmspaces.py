@@ -0,0 +1,23 @@
+"""
+Unit tests for protein_image_grader.rmspaces filename normalization.
+"""
+
+# local repo modules
+import protein_image_grader.rmspaces as rmspaces
+
+
+def test_unicode_to_string_ascii_passthrough():
+	text = "Jane_Doe (2).PNG"
+	assert rmspaces.unicode_to_string(text) == text
+
+
+def test_unicode_to_string_bytes_input():
+	assert rmspaces.unicode_to_string(b"plain name") == "plain name"
+
+
+def test_unicode_to_string_strips_accents():
+	assert rmspaces.unicode_to_string("Jos\u00e9 Pe\u00f1a") == "Jose Pena"
+
+
+def test_unicode_to_string_output_is_ascii():
+	assert rmspaces.unicode_to_string("\u0416\u0435\u043d\u044f \u4e2d").isascii()
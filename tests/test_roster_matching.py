@@ -0,0 +1,77 @@
+"""
+Unit tests for protein_image_grader.roster_matching helpers.
+"""
+
+# local repo modules
+import protein_image_grader.roster_matching as roster_matching
+
+
+def test_build_column_index_ci_keeps_first_match():
+	header = ["Timestamp", " Username ", "USERNAME", "Enter your RUID"]
+	column_index = roster_matching.build_column_index_ci(header)
+	assert column_index == {"timestamp": 0, "username": 1, "enter your ruid": 3}
+
+
+def test_find_column_ci_uses_column_index():
+	header = ["Timestamp", " Username ", "USERNAME", "Enter your RUID"]
+	assert roster_matching.find_column_ci(header, " USERNAME") == 1
+	assert roster_matching.find_column_ci(header, "Email") is None
+
+
+def test_rank_candidates_prefers_exact_name():
+	roster = {
+		900000001: {"first_name": "ana", "last_name": "lopez", "full_name": "ana lopez",
+			"username": "alopez", "alias": ""},
+		900000002: {"first_name": "ann", "last_name": "long", "full_name": "ann long",
+			"username": "along", "alias": ""},
+	}
+	sub = {"username": "alopez@example.edu", "first_name": "Ana", "last_name": "Lopez"}
+	ranked = roster_matching.rank_candidates(sub, roster, 2)
+	assert ranked[0][0] == 900000001
+	assert ranked[0][1] > ranked[1][1]
+
+
+def test_read_roster_uses_alias_columns(tmp_path):
+	roster_csv = tmp_path / "roster.csv"
+	roster_csv.write_text(
+		"StudentID\tFirst\tLast Name\tUsername\tPreferred\n"
+		"900000001\tAna\tLopez\tALopez\tAnnie\n"
+		"\tNo\tId\tnoid\t\n",
+		encoding="ascii",
+	)
+	roster = roster_matching.read_roster(str(roster_csv))
+	assert list(roster) == [900000001]
+	assert roster[900000001]["full_name"] == "ana lopez"
+	assert roster[900000001]["alias"] == "annie"
+
+
+def test_first_record_value_follows_alias_order():
+	record = {"StudentID": 900000001, "Alias": "", "Preferred": "Annie"}
+	assert roster_matching.first_record_value(record, roster_matching.ROSTER_ID_COLUMNS) == 900000001
+	assert roster_matching.first_record_value(record, roster_matching.ROSTER_ALIAS_COLUMNS) == "Annie"
+	assert roster_matching.first_record_value(record, roster_matching.ROSTER_FIRST_COLUMNS) == ""
+
+
+def test_normalize_name_text_cached_result_is_stable():
+	first = roster_matching.normalize_name_text("  Jos\u00e9  O'Neil's (Joe) iPhone ")
+	second = roster_matching.normalize_name_text("  Jos\u00e9  O'Neil's (Joe) iPhone ")
+	assert first == second == "jose oneil"
+
+
+def test_similarity_identical_and_empty():
+	assert roster_matching.similarity("ana lopez", "ana lopez") == 1.0
+	assert roster_matching.similarity("", "") == 0.0
+	assert 0.0 < roster_matching.similarity("ana lopez", "anna lopez") < 1.0
+
+
+def test_score_candidate_matches_normalized_scoring():
+	row = {"first_name": "ana", "last_name": "lopez", "full_name": "ana lopez",
+		"username": "alopez", "alias": "annie"}
+	for sub in (
+		{"username": "alopez2@example.edu", "first_name": "Ana", "last_name": "Lopez"},
+		{"username": "annie", "first_name": "Annie", "last_name": ""},
+		{"username": "", "first_name": "", "last_name": ""},
+	):
+		sub_norm = roster_matching.normalize_submission(sub)
+		expected = roster_matching.score_normalized_candidate(sub_norm, row)
+		assert roster_matching.score_candidate(sub, row) == expected
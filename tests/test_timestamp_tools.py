@@ -0,0 +1,38 @@
+"""
+Unit tests for protein_image_grader.timestamp_tools deduction ranges.
+"""
+
+# Standard Library
+import datetime
+
+# local repo modules
+import protein_image_grader.timestamp_tools as timestamp_tools
+
+
+RANGES = {"-0": 0, "1-24": 1, "25-": 3}
+
+
+def test_get_deduction_open_ended_ranges():
+	assert timestamp_tools.get_deduction(-5, RANGES) == 0
+	assert timestamp_tools.get_deduction(500, RANGES) == 3
+
+
+def test_get_deduction_bounded_range():
+	assert timestamp_tools.get_deduction(24, RANGES) == 1
+
+
+def test_get_deduction_outside_all_ranges():
+	assert timestamp_tools.get_deduction(5, {"10-20": 2}) == 0
+
+
+def test_parse_form_timestamp_drops_timezone():
+	parsed = timestamp_tools.parse_form_timestamp("2024/09/05 3:14:15 PM EST")
+	assert parsed == datetime.datetime(2024, 9, 5, 15, 14, 15)
+
+
+def test_check_due_date_accepts_full_month_name():
+	config = {"deadline": {"due date": "September 5, 2024", "numeric_deductions": {"0-": 1}}}
+	timestamp = "2024/09/05 3:14:15 PM EST"
+	deduction, status, feedback = timestamp_tools.check_due_date(timestamp, config)
+	assert deduction == 0
+	assert status == "On-Time"